@@ -0,0 +1,6 @@
+import json
+from pathlib import Path
+
+# Parsed once at import; resolved next to this file so it doesn't depend on the CWD.
+VIBE_MAPPER = json.loads(Path(__file__).with_name("vibe_mapper.json").read_text())
+INTENTS = list(VIBE_MAPPER.keys())